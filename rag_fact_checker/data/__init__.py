@@ -1,5 +1,6 @@
 from rag_fact_checker.data.data_models import (
     AnswerGeneratorConfig,
+    CacheConfig,
     Config,
     DirectTextMatchOutput,
     ExperimentSetupConfig,
@@ -19,6 +20,7 @@ __all__ = [
     "AnswerGeneratorConfig",
     "TripletGeneratorModelParams",
     "TripletGeneratorConfig",
+    "CacheConfig",
     "LLMConfig",
     "ModelConfig",
     "PathDataConfig",
@@ -1,24 +1,44 @@
-from dataclasses import dataclass, field
-
-
-@dataclass
+from dataclasses import dataclass, field, fields, is_dataclass
+
+
+def _dataclass_from_dict(cls, data):
+    """
+    Recursively build a dataclass instance from a plain dict in one pass.
+
+    Keys absent from the dict keep their defaults; unknown keys are ignored so
+    partial override dicts keep working.
+    """
+    if not isinstance(data, dict):
+        return data
+    kwargs = {}
+    for config_field in fields(cls):
+        if config_field.name not in data:
+            continue
+        value = data[config_field.name]
+        if is_dataclass(config_field.type) and isinstance(value, dict):
+            value = _dataclass_from_dict(config_field.type, value)
+        kwargs[config_field.name] = value
+    return cls(**kwargs)
+
+
+@dataclass(slots=True)
 class ExperimentSetupConfig:
     system_retry: int = 2
     log_prompts: bool = False
 
 
-@dataclass
+@dataclass(slots=True)
 class AnswerGeneratorConfig:
     model_name: str = "llm"
     num_shot: int = 2
 
 
-@dataclass
+@dataclass(slots=True)
 class TripletGeneratorModelParams:
     openie_affinity_probability_cap: float = 0.6
 
 
-@dataclass
+@dataclass(slots=True)
 class TripletGeneratorConfig:
     model_name: str = "llm_n_shot"
     model_params: TripletGeneratorModelParams = field(
@@ -27,7 +47,7 @@ class TripletGeneratorConfig:
     num_shot: int = 3
 
 
-@dataclass
+@dataclass(slots=True)
 class FactCheckerConfig:
     model_name: str = "llm"
     split_reference_triplets: bool = True
@@ -36,7 +56,7 @@ class FactCheckerConfig:
     inquiry_mode: bool = True
 
 
-@dataclass
+@dataclass(slots=True)
 class LLMConfig:
     generator_model: str = "gpt-4o"
     request_max_try: int = 1
@@ -49,7 +69,21 @@ class LLMConfig:
     )
 
 
-@dataclass
+@dataclass(slots=True)
+class CacheConfig:
+    """Configuration for exact-match LLM response caching."""
+
+    enabled: bool = False
+    path: str = "rag_fact_checker_cache.sqlite"
+    ttl_seconds: float | None = None  # None disables expiry
+    max_entries: int = 10000
+    # Semantic (embedding-similarity) layer; needs the semantic-cache extra
+    semantic_enabled: bool = False
+    semantic_threshold: float = 0.95
+    semantic_model: str = "all-MiniLM-L6-v2"
+
+
+@dataclass(slots=True)
 class SimpleBatchConfig:
     """Configuration for simple batch processing."""
 
@@ -59,7 +93,7 @@ class SimpleBatchConfig:
     timeout: float | None = None  # Timeout per individual call
 
 
-@dataclass
+@dataclass(slots=True)
 class ModelConfig:
     answer_generator: AnswerGeneratorConfig = field(
         default_factory=AnswerGeneratorConfig
@@ -74,7 +108,7 @@ class ModelConfig:
     )
 
 
-@dataclass
+@dataclass(slots=True)
 class PathDataConfig:
     base: str = "rag_fact_checker/data/"
     demo: str = "demonstrations"
@@ -90,13 +124,13 @@ def _get_default_prompt_path():
     return str(prompt_path)
 
 
-@dataclass
+@dataclass(slots=True)
 class PathConfig:
     data: PathDataConfig = field(default_factory=PathDataConfig)
     prompts: str = field(default_factory=_get_default_prompt_path)
 
 
-@dataclass
+@dataclass(slots=True)
 class Config:
     experiment_setup: ExperimentSetupConfig = field(
         default_factory=ExperimentSetupConfig
@@ -105,26 +139,44 @@ class Config:
     path: PathConfig = field(default_factory=PathConfig)
     logger_level: str | None = None
     simple_batch_config: SimpleBatchConfig = field(default_factory=SimpleBatchConfig)
+    cache: CacheConfig = field(default_factory=CacheConfig)
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "Config":
+        """
+        Build a fully typed Config from a plain (e.g. JSON-loaded) dict.
+
+        All nested sections are converted to their dataclass types in a single
+        recursive pass, so callers get slotted, typed attribute access without
+        any manual per-section parsing.
+
+        Args:
+            data (dict): Configuration dictionary, typically loaded from JSON.
+
+        Returns:
+            Config: Typed configuration with defaults filled in.
+        """
+        return _dataclass_from_dict(cls, data)
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class TripletGeneratorOutput:
     triplets: list[list[str]]
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class FactCheckerOutput:
     fact_check_prediction_binary: dict[str, bool]
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class HallucinationDataGeneratorOutput:
     generated_hlcntn_answer: str
     generated_non_hlcntn_answer: str
     hlcntn_part: list[str]
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class DirectTextMatchOutput:
     input_triplets: list[list[str]]
     reference_triplets: list[list[str]]
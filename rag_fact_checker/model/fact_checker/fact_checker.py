@@ -34,6 +34,16 @@ class FactChecker(PipelineBase):
         """
         raise NotImplementedError
 
+    @staticmethod
+    def enumerate_triplet_block(triplets: list[list[str]]) -> str:
+        """
+        Render triplets as an indexed, "\\n-"-separated block for prompts and logs.
+
+        Builds the block in a single pass with a generator feeding str.join, so
+        no intermediate list is materialized.
+        """
+        return "\n-".join(f"{idx}: {triplet}" for idx, triplet in enumerate(triplets))
+
     def flatten_triplets(
         self, triplet_segments: list[list[list[str]]]
     ) -> list[list[str]]:
@@ -55,13 +65,12 @@ class FactChecker(PipelineBase):
             self.logger.debug("Keys: %s", keys_list)
             return {}
 
-        all_keys = set().union(*keys_list)
-        merged_fact_check_result = {key: False for key in all_keys}
-
-        # merge the dictionaries
-        for d in output_list:
-            for key, value in d.fact_check_prediction_binary.items():
-                if value:  # if any of the dictionaries has the key as True, set the result to True
-                    merged_fact_check_result[key] = True
+        # OR-reduce the segment predictions in one pass: a triplet is True if
+        # any segment supported it
+        predictions = [d.fact_check_prediction_binary for d in output_list]
+        merged_fact_check_result = {
+            key: any(prediction[key] for prediction in predictions)
+            for key in predictions[0]
+        }
 
         return FactCheckerOutput(fact_check_prediction_binary=merged_fact_check_result)
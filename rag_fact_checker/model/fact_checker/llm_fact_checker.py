@@ -1,4 +1,5 @@
 import logging
+import re
 
 from rag_fact_checker.data import Config, FactCheckerOutput
 from rag_fact_checker.model.fact_checker import FactChecker
@@ -49,6 +50,10 @@ class LLMFactChecker(
 
     """
 
+    # Matches "triplet_idx:result" pairs: optionally signed index digits,
+    # ":" or "=" separator, True/False in any case
+    _PARSE_RE = re.compile(r"(-?\d+)\s*[:=]\s*(true|false)", re.IGNORECASE)
+
     def __init__(self, config: Config, logger: logging.Logger):
         # Initialize all parent classes with the provided configuration
         FactChecker.__init__(self, config, logger)
@@ -73,16 +78,16 @@ class LLMFactChecker(
         if self.config.model.fact_checker.split_reference_triplets:
             output_list = []
             for segment in reference_triplets:
-                self.logger.debug(
-                    "Segment: %s",
-                    "\n-".join(
-                        [
-                            f"{idx} : {str(triplet)}"
+                # Only build the segment dump when debug logging is active
+                if self.logger.isEnabledFor(logging.DEBUG):
+                    self.logger.debug("segment length: %d", len(segment))
+                    self.logger.debug(
+                        "Segment:\n-%s",
+                        "\n-".join(
+                            f"{idx} : {triplet}"
                             for idx, triplet in enumerate(segment)
-                        ]
-                    ),
-                )
-                self.logger.debug("segment length: %s", len(segment))
+                        ),
+                    )
                 fact_check_prediction = self.model_forward(
                     answer_triplets=answer_triplets,
                     reference_triplets=segment,
@@ -161,7 +166,9 @@ class LLMFactChecker(
 
         match_result = response.choices[0].message.content
         # Parse the structured output based on inquiry mode
-        if self.config.experiment_setup.log_prompts:
+        if self.config.experiment_setup.log_prompts and self.logger.isEnabledFor(
+            logging.DEBUG
+        ):
             self.logger.debug(triplet_comparison_prompt)
 
         if self.config.model.fact_checker.inquiry_mode:
@@ -236,14 +243,9 @@ class LLMFactChecker(
                   containing directions and two lists of triplets in text form.
         """
         return {
-            "answer_triplets": "\n-".join(
-                [
-                    f"{idx}: " + str(input_triplet)
-                    for idx, input_triplet in enumerate(answer_triplets)
-                ]
-            ),
+            "answer_triplets": self.enumerate_triplet_block(answer_triplets),
             "reference_triplets": "\n-".join(
-                [str(source_triplet) for source_triplet in reference_triplets]
+                str(source_triplet) for source_triplet in reference_triplets
             ),
         }
 
@@ -303,32 +305,23 @@ class LLMFactChecker(
         Returns:
             dict: A dictionary where keys are triplet indices (int) and values are booleans indicating True/False for each triplet.
         """
-        # Split the output by commas to separate each triplet's result
-        reference_triplets_part = string_output.split("[FINAL ANSWER]")[0]
-        fact_check_result_part = string_output.split("[FINAL ANSWER]")[-1]
-        splitted_string_outputs = (
-            fact_check_result_part.replace("\n", ",")
-            .replace("triplet_idx_", "")
-            .replace("triplet_", "")
-            .split(",")
+        # rpartition picks the last [FINAL ANSWER] marker in a single pass
+        # instead of splitting the whole output twice
+        reference_triplets_part, _, fact_check_result_part = string_output.rpartition(
+            "[FINAL ANSWER]"
         )
-        match_output = {}
-        # Try to evaluate each part as a dictionary entry like "{0:True}"
-        if len(reference_triplets_part) > 0:
+        if reference_triplets_part and self.logger.isEnabledFor(logging.DEBUG):
             self.logger.debug("Reference triplets: %s", reference_triplets_part)
-        for splitted_string_output in splitted_string_outputs:
-            try:
-                # Remove potential hyphens and wrap in braces to form a valid Python dictionary entry
-                match_output.update(
-                    eval("{" + splitted_string_output.replace("-", "") + "}")
-                )
-            except Exception:
-                # If parsing fails, skip that entry
-                self.logger.warning(
-                    f"Failed to parse fact checking output: '{fact_check_result_part}'. Skipping it"
-                )
-                self.logger.debug("Error occured in : %s", fact_check_result_part)
-                pass
+        # One regex pass extracts every "idx:True/False" pair without the
+        # chained replace() copies or per-token eval
+        match_output = {
+            int(match.group(1).lstrip("-")): match.group(2).lower() == "true"
+            for match in self._PARSE_RE.finditer(fact_check_result_part)
+        }
+        if not match_output and fact_check_result_part.strip():
+            self.logger.warning(
+                f"Failed to parse fact checking output: '{fact_check_result_part}'. Skipping it"
+            )
         return match_output
 
     # Batch processing methods
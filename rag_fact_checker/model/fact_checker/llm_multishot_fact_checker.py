@@ -1,8 +1,15 @@
+import asyncio
 import logging
+import re
 
 from rag_fact_checker.data import Config, FactCheckerOutput
 from rag_fact_checker.model.fact_checker import FactChecker
-from rag_fact_checker.pipeline import PipelineDemonstration, PipelineLLM
+from rag_fact_checker.pipeline import (
+    PipelineDemonstration,
+    PipelineLLM,
+    SemanticCache,
+    make_cache_key,
+)
 
 
 class LLMMultiShotFactChecker(FactChecker, PipelineLLM, PipelineDemonstration):
@@ -36,12 +43,42 @@ class LLMMultiShotFactChecker(FactChecker, PipelineLLM, PipelineDemonstration):
             Parses the output from the inquiry mode fact-checking model and returns the comparison result.
     """
 
+    # Matches "triplet_idx:result" pairs: optionally signed index digits,
+    # ":" or "=" separator, True/False in any case
+    _PARSE_RE = re.compile(r"(-?\d+)\s*[:=]\s*(true|false)", re.IGNORECASE)
+
     def __init__(self, config: Config, logger: logging.Logger):
         # Initialize all parent classes with the provided configuration
         FactChecker.__init__(self, config, logger)
         PipelineLLM.__init__(self, config)
         PipelineDemonstration.__init__(self, config)
 
+        # Demonstrations never change per call, so fetch them once and bake
+        # them into the comparison templates; per-call formatting then only
+        # substitutes the answer/reference triplet strings
+        self._cached_examples = self.get_demo_data(demo_type="fact_checker")
+        self.prerender_template_field(
+            "n_shot_triplet_match_test", "examples", self._cached_examples
+        )
+        self.prerender_template_field(
+            "n_shot_triplet_match_test_inquiry", "examples", self._cached_examples
+        )
+
+        # The exact-match response cache is set up by PipelineLLM.__init__
+        # (self.response_cache); only the semantic layer is model-specific
+        cache_config = getattr(config, "cache", None)
+
+        # Optional semantic cache for near-duplicate comparisons (off by default)
+        if cache_config is not None and getattr(
+            cache_config, "semantic_enabled", False
+        ):
+            self.semantic_cache = SemanticCache(
+                threshold=cache_config.semantic_threshold,
+                model_name=cache_config.semantic_model,
+            )
+        else:
+            self.semantic_cache = None
+
     def forward(
         self,
         answer_triplets: list[list[str]],
@@ -58,19 +95,22 @@ class LLMMultiShotFactChecker(FactChecker, PipelineLLM, PipelineDemonstration):
         Returns:
             FactCheckerOutput which contains the binary fact-checking results.
         """
+        empty_output = self._empty_input_output(answer_triplets, reference_triplets)
+        if empty_output is not None:
+            return empty_output
         if self.config.model.fact_checker.split_reference_triplets:
             output_list = []
             for segment in reference_triplets:
-                self.logger.debug(
-                    "Segment: %s",
-                    "\n-".join(
-                        [
-                            f"{idx} : {str(triplet)}"
+                # Only build the segment dump when debug logging is active
+                if self.logger.isEnabledFor(logging.DEBUG):
+                    self.logger.debug("segment length: %d", len(segment))
+                    self.logger.debug(
+                        "Segment:\n-%s",
+                        "\n-".join(
+                            f"{idx} : {triplet}"
                             for idx, triplet in enumerate(segment)
-                        ]
-                    ),
-                )
-                self.logger.debug("segment length: %s", len(segment))
+                        ),
+                    )
                 fact_check_prediction = self.model_forward(
                     answer_triplets=answer_triplets,
                     reference_triplets=segment,
@@ -84,11 +124,251 @@ class LLMMultiShotFactChecker(FactChecker, PipelineLLM, PipelineDemonstration):
                 reference_triplets,
             )
 
+    async def aforward(
+        self,
+        answer_triplets: list[list[str]],
+        reference_triplets: list[list[list[str]]],
+    ) -> FactCheckerOutput:
+        """
+        Async counterpart of forward. In split mode all segment comparisons are
+        independent, so they are fired concurrently with asyncio.gather and the
+        wall time drops from O(num_segments * latency) to O(latency).
+
+        Args:
+            answer_triplets (list): The triplets generated by a model or user.
+            reference_triplets (list): The ground-truth or reference triplets.
+
+        Returns:
+            FactCheckerOutput which contains the binary fact-checking results.
+        """
+        empty_output = self._empty_input_output(answer_triplets, reference_triplets)
+        if empty_output is not None:
+            return empty_output
+        if self.config.model.fact_checker.split_reference_triplets:
+            tasks = [
+                self.amodel_forward(
+                    answer_triplets=answer_triplets,
+                    reference_triplets=segment,
+                )
+                for segment in reference_triplets
+            ]
+            output_list = await asyncio.gather(*tasks)
+            return self.merge_segment_outputs(list(output_list))
+        else:
+            reference_triplets = self.flatten_triplets(reference_triplets)
+            return await self.amodel_forward(
+                answer_triplets,
+                reference_triplets,
+            )
+
     def model_forward(
         self,
         answer_triplets: list[list[str]],
         reference_triplets: list[list[str]],
     ) -> FactCheckerOutput:
+        # Drop duplicated triplets before prompting; overlapping RAG chunks
+        # often repeat references, inflating tokens for no information gain
+        answer_triplets, reference_triplets, index_map = self._deduplicate_inputs(
+            answer_triplets, reference_triplets
+        )
+        # Serve repeated comparisons from the cache before building any prompt
+        cache_key, semantic_text, cached_output = self._cache_lookup(
+            answer_triplets, reference_triplets
+        )
+        if cached_output is not None:
+            return self._project_prediction(cached_output, index_map)
+
+        triplet_comparison_prompt, request_kwargs = self._build_comparison_request(
+            answer_triplets, reference_triplets
+        )
+        response = self.model.chat.completions.create(**request_kwargs)
+        match_result = response.choices[0].message.content
+
+        if self.config.experiment_setup.log_prompts and self.logger.isEnabledFor(
+            logging.DEBUG
+        ):
+            self.logger.debug(triplet_comparison_prompt)
+
+        return self._project_prediction(
+            self._parse_and_store(match_result, cache_key, semantic_text), index_map
+        )
+
+    async def amodel_forward(
+        self,
+        answer_triplets: list[list[str]],
+        reference_triplets: list[list[str]],
+    ) -> FactCheckerOutput:
+        answer_triplets, reference_triplets, index_map = self._deduplicate_inputs(
+            answer_triplets, reference_triplets
+        )
+        # Caches are checked synchronously (cheap); only misses hit the network
+        cache_key, semantic_text, cached_output = self._cache_lookup(
+            answer_triplets, reference_triplets
+        )
+        if cached_output is not None:
+            return self._project_prediction(cached_output, index_map)
+
+        triplet_comparison_prompt, request_kwargs = self._build_comparison_request(
+            answer_triplets, reference_triplets
+        )
+        response = await self.async_model.chat.completions.create(**request_kwargs)
+        match_result = response.choices[0].message.content
+
+        if self.config.experiment_setup.log_prompts and self.logger.isEnabledFor(
+            logging.DEBUG
+        ):
+            self.logger.debug(triplet_comparison_prompt)
+
+        return self._project_prediction(
+            self._parse_and_store(match_result, cache_key, semantic_text), index_map
+        )
+
+    def _empty_input_output(
+        self,
+        answer_triplets: list[list[str]],
+        reference_triplets: list[list[list[str]]],
+    ) -> FactCheckerOutput | None:
+        """
+        Short-circuit when there is nothing to fact-check, avoiding a billable
+        LLM round-trip. Empty answers yield an empty prediction; empty (or
+        all-empty) references mean no answer triplet can be supported, so every
+        answer index is predicted False.
+
+        Returns:
+            The trivial FactCheckerOutput, or None when a model call is needed.
+        """
+        if not answer_triplets:
+            self.logger.debug("No answer triplets to fact-check; skipping model call")
+            return FactCheckerOutput(fact_check_prediction_binary={})
+        if not reference_triplets or all(
+            not segment for segment in reference_triplets
+        ):
+            self.logger.debug("No reference triplets; predicting False for all")
+            return FactCheckerOutput(
+                fact_check_prediction_binary={
+                    idx: False for idx in range(len(answer_triplets))
+                }
+            )
+        return None
+
+    def _deduplicate_inputs(
+        self,
+        answer_triplets: list[list[str]],
+        reference_triplets: list[list[str]],
+    ) -> tuple[list[list[str]], list[list[str]], dict[int, int] | None]:
+        """
+        Deduplicate triplets by content (order-preserving) before prompting.
+
+        Reference triplets can simply be deduplicated. Answer triplets carry
+        meaning through their indices, so an original-index -> deduplicated-index
+        map is returned for projecting the prediction back; it is None when the
+        answer triplets are already unique.
+
+        Returns:
+            Tuple of (answer_triplets, reference_triplets, index_map).
+        """
+        reference_triplets = list(
+            {tuple(triplet): triplet for triplet in reference_triplets}.values()
+        )
+
+        unique_answers: dict[tuple, int] = {}
+        index_map = {}
+        for idx, triplet in enumerate(answer_triplets):
+            key = tuple(triplet)
+            if key not in unique_answers:
+                unique_answers[key] = len(unique_answers)
+            index_map[idx] = unique_answers[key]
+        if len(unique_answers) == len(answer_triplets):
+            return answer_triplets, reference_triplets, None
+        deduplicated_answers = [list(key) for key in unique_answers]
+        return deduplicated_answers, reference_triplets, index_map
+
+    def _project_prediction(
+        self, output: FactCheckerOutput, index_map: dict[int, int] | None
+    ) -> FactCheckerOutput:
+        """
+        Project a deduplicated-index prediction back onto the original indices.
+        """
+        if index_map is None:
+            return output
+        prediction = output.fact_check_prediction_binary
+        return FactCheckerOutput(
+            fact_check_prediction_binary={
+                original_idx: prediction[deduplicated_idx]
+                for original_idx, deduplicated_idx in index_map.items()
+                if deduplicated_idx in prediction
+            }
+        )
+
+    def _cache_lookup(
+        self,
+        answer_triplets: list[list[str]],
+        reference_triplets: list[list[str]],
+    ) -> tuple[str | None, str | None, FactCheckerOutput | None]:
+        """
+        Check the exact and semantic caches for a prior prediction.
+
+        Returns:
+            Tuple of (cache_key, semantic_text, cached FactCheckerOutput or None).
+            The key and text are reused to store the prediction after a miss.
+        """
+        cache_key = None
+        if self.response_cache is not None:
+            cache_key = make_cache_key(
+                {
+                    "mode": "multishot_fc",
+                    "inquiry": self.config.model.fact_checker.inquiry_mode,
+                    "model": self.config.model.llm.generator_model,
+                    "temp": self.config.model.llm.temperature,
+                    "ans": answer_triplets,
+                    "ref": reference_triplets,
+                }
+            )
+            cached_prediction = self.response_cache.get(cache_key)
+            if cached_prediction is not None:
+                # Stored as JSON, so indices come back as strings
+                return (
+                    cache_key,
+                    None,
+                    FactCheckerOutput(
+                        fact_check_prediction_binary={
+                            int(idx): result
+                            for idx, result in cached_prediction.items()
+                        }
+                    ),
+                )
+        # On exact-cache miss, try the semantic cache with just the triplet
+        # strings (examples excluded, as they are identical for every request)
+        semantic_text = None
+        if self.semantic_cache is not None:
+            formatted_input = self.multishot_triplet_comparison_input_formatter(
+                answer_triplets, reference_triplets
+            )
+            semantic_text = (
+                formatted_input["answer_triplets"]
+                + "\n"
+                + formatted_input["reference_triplets"]
+            )
+            cached_prediction = self.semantic_cache.get(semantic_text)
+            if cached_prediction is not None:
+                return (
+                    cache_key,
+                    semantic_text,
+                    FactCheckerOutput(fact_check_prediction_binary=cached_prediction),
+                )
+        return cache_key, semantic_text, None
+
+    def _build_comparison_request(
+        self,
+        answer_triplets: list[list[str]],
+        reference_triplets: list[list[str]],
+    ) -> tuple[list[dict[str, str]], dict]:
+        """
+        Build the comparison prompt and the chat-completion request kwargs.
+
+        Returns:
+            Tuple of (prompt messages, kwargs for chat.completions.create).
+        """
         # Build the prompt for the model by formatting the input triplets
         if self.config.model.fact_checker.inquiry_mode:
             triplet_comparison_prompt = self.get_inquiry_model_prompt(
@@ -100,17 +380,16 @@ class LLMMultiShotFactChecker(FactChecker, PipelineLLM, PipelineDemonstration):
                 answer_triplets,
                 reference_triplets,
             )
-        # Use structured outputs only for non-inquiry mode
-        if self.config.model.fact_checker.inquiry_mode:
-            # Inquiry mode requires text-based output for explanations
-            response = self.model.chat.completions.create(
-                model=self.config.model.llm.generator_model,
-                messages=triplet_comparison_prompt,
-                temperature=self.config.model.llm.temperature,
-            )
-        else:
+        request_kwargs = {
+            "model": self.config.model.llm.generator_model,
+            "messages": triplet_comparison_prompt,
+            "temperature": self.config.model.llm.temperature,
+        }
+        # Use structured outputs only for non-inquiry mode; inquiry mode
+        # requires text-based output for explanations
+        if not self.config.model.fact_checker.inquiry_mode:
             # Define JSON schema for structured fact checking output
-            fact_check_schema = {
+            request_kwargs["response_format"] = {
                 "type": "json_schema",
                 "json_schema": {
                     "name": "fact_check_response",
@@ -137,33 +416,36 @@ class LLMMultiShotFactChecker(FactChecker, PipelineLLM, PipelineDemonstration):
                     "strict": True,
                 },
             }
+        return triplet_comparison_prompt, request_kwargs
 
-            response = self.model.chat.completions.create(
-                model=self.config.model.llm.generator_model,
-                messages=triplet_comparison_prompt,
-                temperature=self.config.model.llm.temperature,
-                response_format=fact_check_schema,
-            )
-
-        match_result = response.choices[0].message.content
-        # Parse the raw string output into a structured dictionary of triplet_idx: boolean_result
-
-        if self.config.experiment_setup.log_prompts:
-            self.logger.debug(triplet_comparison_prompt)
-
+    def _parse_and_store(
+        self,
+        match_result: str,
+        cache_key: str | None,
+        semantic_text: str | None,
+    ) -> FactCheckerOutput:
+        """
+        Parse the raw model output and store the prediction in enabled caches.
+        """
         if self.config.model.fact_checker.inquiry_mode:
-            return FactCheckerOutput(
-                fact_check_prediction_binary=self.parse_triplet_comparison_inquiry_output(
-                    match_result
-                )
+            fact_check_prediction_binary = self.parse_triplet_comparison_inquiry_output(
+                match_result
             )
         else:
-            return FactCheckerOutput(
-                fact_check_prediction_binary=self.parse_triplet_comparison_output(
-                    match_result
-                )
+            fact_check_prediction_binary = self.parse_triplet_comparison_output(
+                match_result
             )
 
+        if self.response_cache is not None:
+            # Store the already-parsed prediction so hits also skip parsing
+            self.response_cache.set(cache_key, fact_check_prediction_binary)
+        if self.semantic_cache is not None:
+            self.semantic_cache.set(semantic_text, fact_check_prediction_binary)
+
+        return FactCheckerOutput(
+            fact_check_prediction_binary=fact_check_prediction_binary
+        )
+
     def get_model_prompt(
         self,
         answer_triplets: list[list[str]],
@@ -210,23 +492,11 @@ class LLMMultiShotFactChecker(FactChecker, PipelineLLM, PipelineDemonstration):
         Returns:
             MultishotFactCheckerModelInput
         """
-        examples = self.get_demo_data(
-            demo_type="fact_checker",
-        )
+        # The examples block is pre-rendered into the templates in __init__,
+        # so only the variable fields are produced here
         return {
-            "answer_triplets": "\n-".join(
-                [
-                    f"{idx}: " + str(input_triplet)
-                    for idx, input_triplet in enumerate(answer_triplets)
-                ]
-            ),
-            "reference_triplets": "\n-".join(
-                [
-                    f"{idx}: " + str(source_triplet)
-                    for idx, source_triplet in enumerate(reference_triplets)
-                ]
-            ),
-            "examples": examples,
+            "answer_triplets": self.enumerate_triplet_block(answer_triplets),
+            "reference_triplets": self.enumerate_triplet_block(reference_triplets),
         }
 
     def parse_triplet_comparison_output(self, string_output: str) -> dict[int, bool]:
@@ -284,30 +554,21 @@ class LLMMultiShotFactChecker(FactChecker, PipelineLLM, PipelineDemonstration):
         Returns:
             dict: A dictionary where keys are triplet indices (int) and values are booleans indicating True/False for each triplet.
         """
-        # Split the output by commas to separate each triplet's result
-        reference_triplets_part = string_output.split("[FINAL ANSWER]")[0]
-        fact_check_result_part = string_output.split("[FINAL ANSWER]")[-1]
-        splitted_string_outputs = (
-            fact_check_result_part.replace("\n", ",")
-            .replace("triplet_idx_", "")
-            .replace("triplet_", "")
-            .split(",")
+        # rpartition avoids materializing the intermediate list a split would
+        reference_triplets_part, _, fact_check_result_part = string_output.rpartition(
+            "[FINAL ANSWER]"
         )
-        match_output = {}
-        # Try to evaluate each part as a dictionary entry like "{0:True}"
-        if len(reference_triplets_part) > 0:
+        if reference_triplets_part and self.logger.isEnabledFor(logging.DEBUG):
             self.logger.debug("Reference triplets: %s", reference_triplets_part)
-        for splitted_string_output in splitted_string_outputs:
-            try:
-                # Remove potential hyphens and wrap in braces to form a valid Python dictionary entry
-                match_output.update(
-                    eval("{" + splitted_string_output.replace("-", "") + "}")
-                )
-            except Exception:
-                # If parsing fails, skip that entry
-                self.logger.warning(
-                    f"Failed to parse fact checking output: '{fact_check_result_part}'. Skipping it"
-                )
-                self.logger.debug("Error occured in : %s", fact_check_result_part)
-                pass
+        # Extract every "idx:True/False" pair in one pass over the output;
+        # hyphens from list bullets and "triplet_idx_" prefixes are skipped
+        # by the pattern itself, so no per-token eval or replace is needed
+        match_output = {
+            int(match.group(1).lstrip("-")): match.group(2).lower() == "true"
+            for match in self._PARSE_RE.finditer(fact_check_result_part)
+        }
+        if not match_output and fact_check_result_part.strip():
+            self.logger.warning(
+                f"Failed to parse fact checking output: '{fact_check_result_part}'. Skipping it"
+            )
         return match_output
@@ -71,8 +71,10 @@ class LLMMultiShotSplitFactChecker(FactChecker, PipelineLLM, PipelineDemonstrati
             comparison_result[idx] = parsed_output
 
         # log only the last prompt
-        if self.config.experiment_setup.log_prompts:
-            self.logger.debug(splitted_triplet_comparison_prompt)
+        if self.config.experiment_setup.log_prompts and self.logger.isEnabledFor(
+            logging.DEBUG
+        ):
+            self.logger.debug("%s", splitted_triplet_comparison_prompt)
 
         return FactCheckerOutput(fact_check_prediction_binary=comparison_result)
 
@@ -139,17 +141,18 @@ class LLMMultiShotSplitFactChecker(FactChecker, PipelineLLM, PipelineDemonstrati
             answer_triplets (list): A list of triplets representing the answer.
 
         Returns:
-            list or bool: The parsed final answer as a list if successful, otherwise False.
+            bool: True if the final verdict is "true", False otherwise (including unparseable output).
         """
-        try:
-            answer_part = string_output.split("[FINAL ANSWER]")[-1]
-            splitted_string_outputs = answer_part.split(":")[-1].strip()
-
-            return eval(splitted_string_outputs)
-        except Exception as e:
+        # The final verdict is the text after the last colon of the last
+        # [FINAL ANSWER] section; compare it directly instead of eval()-ing it
+        answer_part = string_output.rpartition("[FINAL ANSWER]")[2]
+        verdict = answer_part.rpartition(":")[2].strip().lower()
+        if verdict == "true":
+            return True
+        if verdict != "false":
             self.logger.warning(
-                "Failed to parse the splitted fact checker output : %s", str(e)
+                "Failed to parse the splitted fact checker output: %r", verdict
             )
             self.logger.debug("Error occured in : %s", string_output)
             self.logger.debug("Answer triplets: %s", answer_triplets)
-            return False
+        return False
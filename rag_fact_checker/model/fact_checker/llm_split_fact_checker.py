@@ -72,8 +72,10 @@ class LLMSplitFactChecker(FactChecker, PipelineLLM, PipelinePrompt):
             comparison_result[idx] = parsed_output
 
         # log only the last prompt
-        if self.config.experiment_setup.log_prompts:
-            self.logger.debug(splitted_triplet_comparison_prompt)
+        if self.config.experiment_setup.log_prompts and self.logger.isEnabledFor(
+            logging.DEBUG
+        ):
+            self.logger.debug("%s", splitted_triplet_comparison_prompt)
 
         return FactCheckerOutput(comparison_result)
 
@@ -136,17 +138,18 @@ class LLMSplitFactChecker(FactChecker, PipelineLLM, PipelinePrompt):
             answer_triplets (list): The answer triplets used for comparison.
 
         Returns:
-            list or bool: The parsed final answer as a list if successful, otherwise False.
+            bool: True if the final verdict is "true", False otherwise (including unparseable output).
         """
-        try:
-            answer_part = string_output.split("[FINAL ANSWER]")[-1]
-            splitted_string_outputs = answer_part.split(":")[-1].strip()
-
-            return eval(splitted_string_outputs)
-        except Exception as e:
+        # The final verdict is the text after the last colon of the last
+        # [FINAL ANSWER] section; compare it directly instead of eval()-ing it
+        answer_part = string_output.rpartition("[FINAL ANSWER]")[2]
+        verdict = answer_part.rpartition(":")[2].strip().lower()
+        if verdict == "true":
+            return True
+        if verdict != "false":
             self.logger.warning(
-                "Failed to parse the splitted fact checker output. : %s", str(e)
+                "Failed to parse the splitted fact checker output.: %r", verdict
             )
             self.logger.debug("Error occured in : %s", string_output)
             self.logger.debug("Answer triplets: %s", answer_triplets)
-            return False
+        return False
@@ -134,8 +134,10 @@ class AnswerBasedHallucinationDataGenerator(
 
         hallucination_output = response.choices[0].message.content
 
-        if self.config.experiment_setup.log_prompts:
-            self.logger.debug(hallucination_prompt)
+        if self.config.experiment_setup.log_prompts and self.logger.isEnabledFor(
+            logging.DEBUG
+        ):
+            self.logger.debug("%s", hallucination_prompt)
 
         hallucinated_answer, error_details = (
             self.parse_answer_based_hallucination_output(hallucination_output)
@@ -236,8 +238,10 @@ class AnswerBasedHallucinationDataGenerator(
 
         hallucination_output = response.choices[0].message.content
 
-        if self.config.experiment_setup.log_prompts:
-            self.logger.debug(hallucination_prompt)
+        if self.config.experiment_setup.log_prompts and self.logger.isEnabledFor(
+            logging.DEBUG
+        ):
+            self.logger.debug("%s", hallucination_prompt)
 
         hallucinated_answer, error_details = (
             self.parse_answer_based_hallucination_output(hallucination_output)
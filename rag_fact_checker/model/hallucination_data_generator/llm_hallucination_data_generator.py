@@ -1,4 +1,5 @@
 import logging
+from functools import lru_cache
 
 from rag_fact_checker.data import Config, HallucinationDataGeneratorOutput
 from rag_fact_checker.model.hallucination_data_generator.hallucination_data_generator import (
@@ -10,6 +11,26 @@ from rag_fact_checker.pipeline.simple_batch_processor import (
 )
 
 
+@lru_cache(maxsize=1)
+def hallucination_response_model() -> type:
+    """
+    Build (once) the structured response schema for hallucination data generation.
+
+    pydantic is imported here rather than at module top so that importing the
+    model package stays cheap for users who never touch the LLM paths.
+    """
+    from pydantic import BaseModel
+
+    class HallucinationResponse(BaseModel):
+        """Structured response schema for hallucination data generation."""
+
+        non_hallucinated_answer: str
+        hallucinated_answer: str
+        hallucinated_details: list[str]
+
+    return HallucinationResponse
+
+
 class LLMHallucinationDataGenerator(
     HallucinationDataGenerator, SimpleBatchProcessingMixin
 ):
@@ -108,58 +129,15 @@ class LLMHallucinationDataGenerator(
             reference_documents=reference_text,
             question=question,
         )
-        # Define JSON schema for structured outputs
-        hallucination_schema = {
-            "type": "json_schema",
-            "json_schema": {
-                "name": "hallucination_response",
-                "schema": {
-                    "type": "object",
-                    "properties": {
-                        "non_hallucinated_answer": {
-                            "type": "string",
-                            "description": "Comprehensive, evidence-based answer using only reference documents",
-                        },
-                        "hallucinated_answer": {
-                            "type": "string",
-                            "description": "Same as non_hallucinated_answer but with subtle fictional details added",
-                        },
-                        "hallucinated_details": {
-                            "type": "array",
-                            "items": {"type": "string"},
-                            "description": "List of each hallucinated fact as separate elements",
-                        },
-                    },
-                    "required": [
-                        "non_hallucinated_answer",
-                        "hallucinated_answer",
-                        "hallucinated_details",
-                    ],
-                    "additionalProperties": False,
-                },
-                "strict": True,
-            },
-        }
-
-        response = self.model.chat.completions.create(
+        # The SDK validates the streamed response against the schema and hands
+        # back a parsed object, so no json.loads / .get passes are needed here
+        response = self.model.beta.chat.completions.parse(
             model=self.config.model.llm.generator_model,
             messages=hlcntn_generation_prompt,
             temperature=self.config.model.llm.temperature,
-            response_format=hallucination_schema,
-        )
-        hlcntn_data_generation_output = response.choices[0].message.content
-
-        generated_non_hlcntn_answer, generated_hlcntn_answer, hlcntn_part = (
-            self.parse_hlcntn_data_generation_output(hlcntn_data_generation_output)
-        )
-
-        return HallucinationDataGeneratorOutput(
-            **{
-                "generated_non_hlcntn_answer": generated_non_hlcntn_answer,
-                "generated_hlcntn_answer": generated_hlcntn_answer,
-                "hlcntn_part": hlcntn_part,
-            }
+            response_format=hallucination_response_model(),
         )
+        return self._output_from_parsed(response.choices[0].message.parsed)
 
     async def generate_hlcntn_data_async(
         self, reference_text: str, question: str
@@ -183,58 +161,38 @@ class LLMHallucinationDataGenerator(
             reference_documents=reference_text,
             question=question,
         )
-        # Define JSON schema for structured outputs
-        hallucination_schema = {
-            "type": "json_schema",
-            "json_schema": {
-                "name": "hallucination_response",
-                "schema": {
-                    "type": "object",
-                    "properties": {
-                        "non_hallucinated_answer": {
-                            "type": "string",
-                            "description": "Comprehensive, evidence-based answer using only reference documents",
-                        },
-                        "hallucinated_answer": {
-                            "type": "string",
-                            "description": "Same as non_hallucinated_answer but with subtle fictional details added",
-                        },
-                        "hallucinated_details": {
-                            "type": "array",
-                            "items": {"type": "string"},
-                            "description": "List of each hallucinated fact as separate elements",
-                        },
-                    },
-                    "required": [
-                        "non_hallucinated_answer",
-                        "hallucinated_answer",
-                        "hallucinated_details",
-                    ],
-                    "additionalProperties": False,
-                },
-                "strict": True,
-            },
-        }
-
         # Use async client for true async operation
-        response = await self.async_model.chat.completions.create(
+        response = await self.async_model.beta.chat.completions.parse(
             model=self.config.model.llm.generator_model,
             messages=hlcntn_generation_prompt,
             temperature=self.config.model.llm.temperature,
-            response_format=hallucination_schema,
+            response_format=hallucination_response_model(),
         )
-        hlcntn_data_generation_output = response.choices[0].message.content
+        return self._output_from_parsed(response.choices[0].message.parsed)
 
-        generated_non_hlcntn_answer, generated_hlcntn_answer, hlcntn_part = (
-            self.parse_hlcntn_data_generation_output(hlcntn_data_generation_output)
-        )
+    def _output_from_parsed(self, parsed) -> HallucinationDataGeneratorOutput:
+        """
+        Convert an SDK-parsed HallucinationResponse into the output dataclass.
 
+        Args:
+            parsed: Parsed response object, or None if the model refused.
+
+        Returns:
+            HallucinationDataGeneratorOutput with empty fields on refusal.
+        """
+        if parsed is None:
+            self.logger.warning(
+                "Hallucination data generation returned no parsed output"
+            )
+            return HallucinationDataGeneratorOutput(
+                generated_non_hlcntn_answer="",
+                generated_hlcntn_answer="",
+                hlcntn_part=[],
+            )
         return HallucinationDataGeneratorOutput(
-            **{
-                "generated_non_hlcntn_answer": generated_non_hlcntn_answer,
-                "generated_hlcntn_answer": generated_hlcntn_answer,
-                "hlcntn_part": hlcntn_part,
-            }
+            generated_non_hlcntn_answer=parsed.non_hallucinated_answer.strip(),
+            generated_hlcntn_answer=parsed.hallucinated_answer.strip(),
+            hlcntn_part=parsed.hallucinated_details,
         )
 
     def parse_hlcntn_data_generation_output(
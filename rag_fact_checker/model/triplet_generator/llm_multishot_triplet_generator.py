@@ -1,11 +1,41 @@
+import asyncio
+import json
 import logging
+from collections.abc import Iterator
 
 from rag_fact_checker.data import Config, TripletGeneratorOutput
 from rag_fact_checker.model.triplet_generator.triplet_generator import (
     TripletGenerator,
+    parse_triplet_payload,
 )
 from rag_fact_checker.pipeline import PipelineDemonstration, PipelineLLM
 
+# Static request schema for structured triplet output; built once at import
+TRIPLET_SCHEMA = {
+    "type": "json_schema",
+    "json_schema": {
+        "name": "triplet_generation_response",
+        "schema": {
+            "type": "object",
+            "properties": {
+                "triplets": {
+                    "type": "array",
+                    "items": {
+                        "type": "array",
+                        "items": {"type": "string"},
+                        "minItems": 3,
+                        "maxItems": 3,
+                    },
+                    "description": "Array of triplets, each containing [subject, predicate, object]",
+                }
+            },
+            "required": ["triplets"],
+            "additionalProperties": False,
+        },
+        "strict": True,
+    },
+}
+
 
 class LLMMultiShotTripletGenerator(
     TripletGenerator, PipelineLLM, PipelineDemonstration
@@ -39,6 +69,31 @@ class LLMMultiShotTripletGenerator(
         PipelineLLM.__init__(self, config)
         PipelineDemonstration.__init__(self, config)
 
+        # The demo set is static for the lifetime of the generator, so fetch
+        # it once and bake it into the template; per-call formatting then only
+        # substitutes the input text
+        self._cached_examples = self.get_demo_data(demo_type="triplet_generator")
+        self.prerender_template_field(
+            "n_shot_triplet_generation", "examples", self._cached_examples
+        )
+
+    def _triplet_generation_request(self, input_text: str) -> dict:
+        """
+        Build the chat.completions request kwargs for one input text.
+
+        Args:
+            input_text (str): The input text data from which triplets are to be generated.
+
+        Returns:
+            dict: Keyword arguments for (a)cached_chat_completion.
+        """
+        return {
+            "model": self.config.model.llm.generator_model,
+            "messages": self.get_model_prompt(input_text),
+            "temperature": self.config.model.llm.temperature,
+            "response_format": TRIPLET_SCHEMA,
+        }
+
     def forward(self, input_text: str) -> TripletGeneratorOutput:
         """
         Processes the input data to generate triplets using a model.
@@ -49,48 +104,130 @@ class LLMMultiShotTripletGenerator(
         Returns:
             TripletGeneratorOutput: TripletGeneratorOutput which has a list of triplets generated from the input data.
         """
-        triplet_generation_prompt = self.get_model_prompt(input_text)
-
-        # Define JSON schema for structured triplet output
-        triplet_schema = {
-            "type": "json_schema",
-            "json_schema": {
-                "name": "triplet_generation_response",
-                "schema": {
-                    "type": "object",
-                    "properties": {
-                        "triplets": {
-                            "type": "array",
-                            "items": {
-                                "type": "array",
-                                "items": {"type": "string"},
-                                "minItems": 3,
-                                "maxItems": 3,
-                            },
-                            "description": "Array of triplets, each containing [subject, predicate, object]",
-                        }
-                    },
-                    "required": ["triplets"],
-                    "additionalProperties": False,
-                },
-                "strict": True,
-            },
-        }
+        request_kwargs = self._triplet_generation_request(input_text)
+
+        # Served from the on-disk response cache when the same text was
+        # already processed with identical settings (see config.cache)
+        triplet_generation_output = self.cached_chat_completion(**request_kwargs)
 
-        response = self.model.chat.completions.create(
-            model=self.config.model.llm.generator_model,
-            messages=triplet_generation_prompt,
-            temperature=self.config.model.llm.temperature,
-            response_format=triplet_schema,
+        if self.config.experiment_setup.log_prompts and self.logger.isEnabledFor(
+            logging.DEBUG
+        ):
+            self.logger.debug("%s", request_kwargs["messages"])
+        return TripletGeneratorOutput(
+            triplets=self.parse_triplet_generation_output(triplet_generation_output)
         )
-        triplet_generation_output = response.choices[0].message.content
 
-        if self.config.experiment_setup.log_prompts:
-            self.logger.debug(triplet_generation_prompt)
+    async def aforward(self, input_text: str) -> TripletGeneratorOutput:
+        """
+        Async counterpart of forward, using the AsyncOpenAI client.
+
+        Args:
+            input_text (str): The input text data from which triplets are to be generated.
+
+        Returns:
+            TripletGeneratorOutput: TripletGeneratorOutput which has a list of triplets generated from the input data.
+        """
+        request_kwargs = self._triplet_generation_request(input_text)
+
+        triplet_generation_output = await self.acached_chat_completion(**request_kwargs)
+
+        if self.config.experiment_setup.log_prompts and self.logger.isEnabledFor(
+            logging.DEBUG
+        ):
+            self.logger.debug("%s", request_kwargs["messages"])
         return TripletGeneratorOutput(
             triplets=self.parse_triplet_generation_output(triplet_generation_output)
         )
 
+    def forward_stream(self, input_text: str) -> Iterator[list[str]]:
+        """
+        Stream the completion and yield triplets as soon as they complete.
+
+        Instead of blocking on the full response before parsing, the token
+        stream is scanned incrementally and every closed ["subject",
+        "predicate", "object"] array inside the triplets payload is parsed
+        and yielded immediately, so downstream consumers can start working at
+        first-triplet latency. Streamed responses bypass the response cache.
+
+        Args:
+            input_text (str): The input text data from which triplets are to be generated.
+
+        Yields:
+            list[str]: Each validated triplet, in generation order.
+        """
+        request_kwargs = self._triplet_generation_request(input_text)
+        stream = self.model.chat.completions.create(stream=True, **request_kwargs)
+
+        # Incremental scan state: bracket depth outside JSON strings; the
+        # triplets array sits at depth 1, each triplet at depth 2
+        buffer = ""
+        scan_start = 0
+        depth = 0
+        in_string = False
+        escaped = False
+        triplet_start = -1
+        for chunk in stream:
+            if not chunk.choices:
+                continue
+            delta = chunk.choices[0].delta.content
+            if not delta:
+                continue
+            buffer += delta
+            for idx in range(scan_start, len(buffer)):
+                char = buffer[idx]
+                if in_string:
+                    if escaped:
+                        escaped = False
+                    elif char == "\\":
+                        escaped = True
+                    elif char == '"':
+                        in_string = False
+                elif char == '"':
+                    in_string = True
+                elif char == "[":
+                    depth += 1
+                    if depth == 2:
+                        triplet_start = idx
+                elif char == "]":
+                    if depth == 2 and triplet_start != -1:
+                        try:
+                            candidate = json.loads(buffer[triplet_start : idx + 1])
+                        except json.JSONDecodeError:
+                            candidate = None
+                        if isinstance(candidate, list) and len(candidate) == 3:
+                            yield [str(item) for item in candidate]
+                        else:
+                            self.logger.warning(
+                                "Invalid streamed triplet: %s",
+                                buffer[triplet_start : idx + 1],
+                            )
+                        triplet_start = -1
+                    depth -= 1
+            scan_start = len(buffer)
+
+    async def aforward_batch(
+        self, input_texts: list[str]
+    ) -> list[TripletGeneratorOutput]:
+        """
+        Generate triplets for many input texts concurrently.
+
+        All requests are fired through asyncio.gather, so wall-clock time is
+        bounded by the slowest single request instead of the sum of all
+        round-trips.
+
+        Args:
+            input_texts (list[str]): Input texts to generate triplets from.
+
+        Returns:
+            list[TripletGeneratorOutput]: One output per input text, in order.
+        """
+        return list(
+            await asyncio.gather(
+                *(self.aforward(input_text) for input_text in input_texts)
+            )
+        )
+
     @property
     def default_triplet(self):
         """
@@ -131,10 +268,8 @@ class LLMMultiShotTripletGenerator(
         Returns:
             dict: A dictionary containing the formatted input text with the key 'input_text'.
         """
-        examples = self.get_demo_data(
-            demo_type="triplet_generator",
-        )
-        return {"input_text": input_text, "examples": examples}
+        # Examples are pre-rendered into the template at __init__ time
+        return {"input_text": input_text}
 
     def parse_triplet_generation_output(
         self, triplet_generation_output: str
@@ -147,32 +282,19 @@ class LLMMultiShotTripletGenerator(
         Returns:
             list: A list of triplets parsed from the JSON output. If parsing fails, returns default triplet.
         """
-        import json
-
-        try:
-            # Parse JSON output
-            data = json.loads(triplet_generation_output.strip())
-            triplets = data.get("triplets", [])
-
-            # Validate triplets and fix any invalid ones
-            result = []
-            for triplet in triplets:
-                if isinstance(triplet, list) and len(triplet) == 3:
-                    result.append(
-                        [str(item) for item in triplet]
-                    )  # Ensure all elements are strings
-                else:
-                    self.logger.warning("Invalid triplet structure: %s", str(triplet))
-                    result.append(self.default_triplet)
-
-            # Return at least one triplet
-            return result if result else [self.default_triplet]
-
-        except (json.JSONDecodeError, KeyError) as e:
-            self.logger.warning("Error parsing JSON triplet output: %s", str(e))
-            self.logger.debug("Raw triplet output: %s", triplet_generation_output)
+        if triplet_generation_output is None:
+            # Refusals and content filters yield message.content = None
+            self.logger.warning("Triplet generation returned no content")
             return [self.default_triplet]
-        except Exception as e:
-            self.logger.warning("Unexpected error parsing triplet output: %s", str(e))
+        stripped_output = triplet_generation_output.strip()
+        parsed_triplets, warnings = parse_triplet_payload(stripped_output)
+        for message in warnings:
+            self.logger.warning("%s", message)
+        if parsed_triplets is None:
             self.logger.debug("Raw triplet output: %s", triplet_generation_output)
             return [self.default_triplet]
+        if not parsed_triplets:
+            # Return at least one triplet
+            return [self.default_triplet]
+        # Copy out of the shared cache so callers may mutate freely
+        return [list(triplet) for triplet in parsed_triplets]
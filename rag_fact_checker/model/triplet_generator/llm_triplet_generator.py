@@ -3,6 +3,7 @@ import logging
 from rag_fact_checker.data import Config, TripletGeneratorOutput
 from rag_fact_checker.model.triplet_generator.triplet_generator import (
     TripletGenerator,
+    parse_triplet_payload,
 )
 from rag_fact_checker.pipeline import PipelineLLM, PipelinePrompt
 from rag_fact_checker.pipeline.simple_batch_processor import (
@@ -81,16 +82,19 @@ class LLMTripletGenerator(
             },
         }
 
-        response = self.model.chat.completions.create(
+        # Served from the on-disk response cache when the same text was
+        # already processed with identical settings (see config.cache)
+        triplet_generation_output = self.cached_chat_completion(
             model=self.config.model.llm.generator_model,
             messages=triplet_generation_prompt,
             temperature=self.config.model.llm.temperature,
             response_format=triplet_schema,
         )
-        triplet_generation_output = response.choices[0].message.content
 
-        if self.config.experiment_setup.log_prompts:
-            self.logger.debug(triplet_generation_prompt)
+        if self.config.experiment_setup.log_prompts and self.logger.isEnabledFor(
+            logging.DEBUG
+        ):
+            self.logger.debug("%s", triplet_generation_prompt)
 
         return TripletGeneratorOutput(
             triplets=self.parse_triplet_generation_output(triplet_generation_output)
@@ -152,35 +156,22 @@ class LLMTripletGenerator(
         Returns:
             list: A list of triplets parsed from the JSON output. If parsing fails, returns default triplet.
         """
-        import json
-
-        try:
-            # Parse JSON output
-            data = json.loads(triplet_generation_model_output.strip())
-            triplets = data.get("triplets", [])
-
-            # Validate triplets and fix any invalid ones
-            result = []
-            for triplet in triplets:
-                if isinstance(triplet, list) and len(triplet) == 3:
-                    result.append(
-                        [str(item) for item in triplet]
-                    )  # Ensure all elements are strings
-                else:
-                    self.logger.warning("Invalid triplet structure: %s", str(triplet))
-                    result.append(self.default_triplet)
-
-            # Return at least one triplet
-            return result if result else [self.default_triplet]
-
-        except (json.JSONDecodeError, KeyError) as e:
-            self.logger.warning("Error parsing JSON triplet output: %s", str(e))
-            self.logger.debug("Raw triplet output: %s", triplet_generation_model_output)
+        if triplet_generation_model_output is None:
+            # Refusals and content filters yield message.content = None
+            self.logger.warning("Triplet generation returned no content")
             return [self.default_triplet]
-        except Exception as e:
-            self.logger.warning("Unexpected error parsing triplet output: %s", str(e))
+        stripped_output = triplet_generation_model_output.strip()
+        parsed_triplets, warnings = parse_triplet_payload(stripped_output)
+        for message in warnings:
+            self.logger.warning("%s", message)
+        if parsed_triplets is None:
             self.logger.debug("Raw triplet output: %s", triplet_generation_model_output)
             return [self.default_triplet]
+        if not parsed_triplets:
+            # Return at least one triplet
+            return [self.default_triplet]
+        # Copy out of the shared cache so callers may mutate freely
+        return [list(triplet) for triplet in parsed_triplets]
 
     # Batch processing methods
     def forward_batch(
@@ -1,10 +1,63 @@
+import ast
+import json
 import logging
 from abc import abstractmethod
+from functools import lru_cache
 
 from rag_fact_checker.data import Config, TripletGeneratorOutput
 from rag_fact_checker.pipeline import PipelineBase
 
 
+@lru_cache(maxsize=1024)
+def parse_triplet_payload(
+    raw_output: str,
+) -> tuple[tuple[tuple[str, str, str], ...] | None, tuple[str, ...]]:
+    """
+    Pure, cacheable core of triplet output parsing.
+
+    Parses the raw model output (JSON first, ast.literal_eval as fallback)
+    and validates the triplet shapes. Results are returned as immutable
+    tuples so identical raw strings - common in eval suites replaying the
+    same traces - are parsed once and served from the LRU cache afterwards.
+
+    Args:
+        raw_output (str): Stripped raw model output.
+
+    Returns:
+        tuple: (triplets, warnings) where triplets is a tuple of 3-string
+        tuples, or None when the output is unparseable, and warnings holds
+        messages for the caller to log.
+    """
+    warnings = []
+    try:
+        data = json.loads(raw_output)
+    except json.JSONDecodeError:
+        # Some models emit Python-style literals (single quotes); fall back
+        # to ast.literal_eval, which cannot execute code, never to eval()
+        try:
+            data = ast.literal_eval(raw_output)
+        except (ValueError, SyntaxError) as e:
+            return None, (f"Error parsing triplet output: {e}",)
+
+    # Accept either the schema object or a bare list of triplets
+    if isinstance(data, dict):
+        triplets = data.get("triplets", [])
+    elif isinstance(data, list):
+        triplets = data
+    else:
+        return None, (f"Unexpected triplet output type: {type(data)}",)
+
+    # Validate triplets and fix any invalid ones
+    result = []
+    for triplet in triplets:
+        if isinstance(triplet, list) and len(triplet) == 3:
+            result.append(tuple(str(item) for item in triplet))
+        else:
+            warnings.append(f"Invalid triplet structure: {triplet}")
+            result.append(("", "", ""))
+    return tuple(result), tuple(warnings)
+
+
 class TripletGenerator(PipelineBase):
     """
     TripletGenerator is a base class for generating triplets from input data. It inherits from rag_fact_checker.pipelineBase and requires a configuration dictionary during initialization.
@@ -2,10 +2,16 @@ from rag_fact_checker.pipeline.pipeline_base import *
 from rag_fact_checker.pipeline.pipeline_demonstration import *
 from rag_fact_checker.pipeline.pipeline_llm import *
 from rag_fact_checker.pipeline.pipeline_prompt import *
+from rag_fact_checker.pipeline.response_cache import ResponseCache, make_cache_key
+from rag_fact_checker.pipeline.semantic_cache import SemanticCache
 
 __all__ = [
     "PipelineBase",
     "PipelineLLM",
+    "PipelineLLMBatch",
     "PipelinePrompt",
     "PipelineDemonstration",
+    "ResponseCache",
+    "SemanticCache",
+    "make_cache_key",
 ]
@@ -5,13 +5,17 @@ from rag_fact_checker.pipeline.pipeline_prompt import PipelinePrompt
 class PipelineDemonstration(PipelinePrompt):
     def __init__(self, config: Config):
         super().__init__(config)
+        # Demonstrations are static per config, so resolve each type once
+        self._demo_cache: dict[str, str] = {}
 
     @property
     def default_demo_output(self) -> str:
         return ""
 
     def get_demo_data(self, demo_type: str = "triplet_generator") -> str:
-        return getattr(self, f"demo_{demo_type}")
+        if demo_type not in self._demo_cache:
+            self._demo_cache[demo_type] = getattr(self, f"demo_{demo_type}")
+        return self._demo_cache[demo_type]
 
     @property
     def demo_triplet_generator(self) -> str:
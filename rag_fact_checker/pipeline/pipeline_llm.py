@@ -1,7 +1,108 @@
-from openai import AsyncOpenAI, OpenAI
+from __future__ import annotations
+
+import atexit
+import json
+from functools import lru_cache
+from typing import TYPE_CHECKING
 
 from rag_fact_checker.data import Config
 from rag_fact_checker.pipeline.pipeline_base import PipelineBase
+from rag_fact_checker.pipeline.response_cache import ResponseCache, make_cache_key
+
+if TYPE_CHECKING:
+    import httpx
+
+# httpx and the OpenAI SDK are imported lazily: together they account for most
+# of this package's cold-start import time, and users on the DirectTextMatch
+# path never need them. All OpenAI clients share one httpx transport per
+# flavor (sync/async), so connections are kept alive and reused across calls
+# and across model instances: only the first request pays the TCP+TLS
+# handshake. HTTP/2 multiplexing is enabled when the optional h2 package is
+# installed.
+_HTTP_MAX_KEEPALIVE_CONNECTIONS = 32
+_HTTP_MAX_CONNECTIONS = 64
+_HTTP_TIMEOUT = 60.0
+
+_shared_http_client: httpx.Client | None = None
+_shared_async_http_client: httpx.AsyncClient | None = None
+
+
+def _http2_available() -> bool:
+    try:
+        import h2  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+def get_shared_http_client() -> httpx.Client:
+    """Return the process-wide httpx.Client, creating it on first use."""
+    global _shared_http_client
+    if _shared_http_client is None:
+        import httpx
+
+        _shared_http_client = httpx.Client(
+            http2=_http2_available(),
+            timeout=_HTTP_TIMEOUT,
+            limits=httpx.Limits(
+                max_keepalive_connections=_HTTP_MAX_KEEPALIVE_CONNECTIONS,
+                max_connections=_HTTP_MAX_CONNECTIONS,
+            ),
+        )
+    return _shared_http_client
+
+
+def get_shared_async_http_client() -> httpx.AsyncClient:
+    """Return the process-wide httpx.AsyncClient, creating it on first use."""
+    global _shared_async_http_client
+    if _shared_async_http_client is None:
+        import httpx
+
+        _shared_async_http_client = httpx.AsyncClient(
+            http2=_http2_available(),
+            timeout=_HTTP_TIMEOUT,
+            limits=httpx.Limits(
+                max_keepalive_connections=_HTTP_MAX_KEEPALIVE_CONNECTIONS,
+                max_connections=_HTTP_MAX_CONNECTIONS,
+            ),
+        )
+    return _shared_async_http_client
+
+
+@atexit.register
+def _close_shared_http_clients() -> None:
+    """Close the shared transports (if ever created) at interpreter exit."""
+    if _shared_http_client is not None:
+        _shared_http_client.close()
+    if _shared_async_http_client is not None:
+        import asyncio
+
+        try:
+            asyncio.run(_shared_async_http_client.aclose())
+        except RuntimeError:
+            # An event loop is still running or closed; the OS reclaims the
+            # sockets at process exit anyway
+            pass
+
+
+@lru_cache(maxsize=16)
+def _get_openai_clients(api_key, base_url, max_retries):
+    """
+    Build (or reuse) the OpenAI client pair for one connection configuration.
+
+    Every PipelineLLM subclass in a validator run targets the same endpoint,
+    so the sync/async clients are memoized per (api_key, base_url,
+    max_retries) instead of being duplicated per instance.
+    """
+    from openai import AsyncOpenAI, OpenAI
+
+    client_kwargs = {"api_key": api_key, "max_retries": max_retries}
+    if base_url:
+        client_kwargs["base_url"] = base_url
+    return (
+        OpenAI(http_client=get_shared_http_client(), **client_kwargs),
+        AsyncOpenAI(http_client=get_shared_async_http_client(), **client_kwargs),
+    )
 
 
 class PipelineLLM(PipelineBase):
@@ -14,23 +115,163 @@ class PipelineLLM(PipelineBase):
 
     def __init__(self, config: Config):
         super().__init__(config)
-        if self.config.model.llm.base_url:
-            self.model = OpenAI(
-                api_key=self.config.model.llm.api_key,
-                max_retries=self.config.model.llm.request_max_try,
-                base_url=self.config.model.llm.base_url,
-            )
-            self.async_model = AsyncOpenAI(
-                api_key=self.config.model.llm.api_key,
-                max_retries=self.config.model.llm.request_max_try,
-                base_url=self.config.model.llm.base_url,
+        self.model, self.async_model = _get_openai_clients(
+            self.config.model.llm.api_key,
+            self.config.model.llm.base_url or None,
+            self.config.model.llm.request_max_try,
+        )
+
+        # Optional on-disk exact-match cache shared by all LLM round-trips
+        # made through cached_chat_completion (enabled via config.cache)
+        cache_config = getattr(config, "cache", None)
+        if cache_config is not None and getattr(cache_config, "enabled", False):
+            self.response_cache = ResponseCache(
+                path=cache_config.path,
+                ttl_seconds=cache_config.ttl_seconds,
+                max_entries=cache_config.max_entries,
             )
         else:
-            self.model = OpenAI(
-                api_key=self.config.model.llm.api_key,
-                max_retries=self.config.model.llm.request_max_try,
+            self.response_cache = None
+
+    def cached_chat_completion(self, **request_kwargs) -> str:
+        """
+        Run a chat completion, serving exact repeats from the on-disk cache.
+
+        The cache key covers the full request (model, messages, temperature,
+        response_format, ...), so any change to the prompt or sampling
+        parameters misses and triggers a real call. With caching disabled this
+        is a plain passthrough to ``chat.completions.create``.
+
+        Args:
+            **request_kwargs: Keyword arguments for ``chat.completions.create``.
+
+        Returns:
+            str: The response message content.
+        """
+        if self.response_cache is None:
+            response = self.model.chat.completions.create(**request_kwargs)
+            return response.choices[0].message.content
+        cache_key = make_cache_key(request_kwargs)
+        cached_content = self.response_cache.get(cache_key)
+        if cached_content is not None:
+            return cached_content
+        response = self.model.chat.completions.create(**request_kwargs)
+        content = response.choices[0].message.content
+        self.response_cache.set(cache_key, content)
+        return content
+
+    async def acached_chat_completion(self, **request_kwargs) -> str:
+        """
+        Async counterpart of cached_chat_completion.
+
+        Args:
+            **request_kwargs: Keyword arguments for ``chat.completions.create``.
+
+        Returns:
+            str: The response message content.
+        """
+        if self.response_cache is None:
+            response = await self.async_model.chat.completions.create(**request_kwargs)
+            return response.choices[0].message.content
+        cache_key = make_cache_key(request_kwargs)
+        cached_content = self.response_cache.get(cache_key)
+        if cached_content is not None:
+            return cached_content
+        response = await self.async_model.chat.completions.create(**request_kwargs)
+        content = response.choices[0].message.content
+        self.response_cache.set(cache_key, content)
+        return content
+
+
+class PipelineLLMBatch(PipelineLLM):
+    """
+    Batch-submission pipeline for non-interactive workloads.
+
+    Packages many chat.completions requests into a JSONL payload and submits
+    them through the OpenAI Batch API, which trades interactivity (results
+    arrive within the completion window instead of immediately) for roughly
+    half the per-token price and much higher aggregate throughput. Intended
+    for offline evaluation and regression runs; interactive paths should keep
+    using PipelineLLM directly.
+    """
+
+    BATCH_ENDPOINT = "/v1/chat/completions"
+
+    def submit_batch(
+        self, request_kwargs_list: list[dict], completion_window: str = "24h"
+    ) -> str:
+        """
+        Submit a list of chat.completions requests as one batch.
+
+        Args:
+            request_kwargs_list (list[dict]): One kwargs dict per request, as
+                accepted by ``chat.completions.create`` (model, messages, ...).
+            completion_window (str): Batch API completion window, e.g. "24h".
+
+        Returns:
+            str: The batch id to poll with ``poll_batch``.
+        """
+        jsonl_payload = "\n".join(
+            json.dumps(
+                {
+                    "custom_id": f"request-{idx}",
+                    "method": "POST",
+                    "url": self.BATCH_ENDPOINT,
+                    "body": request_kwargs,
+                },
+                ensure_ascii=False,
             )
-            self.async_model = AsyncOpenAI(
-                api_key=self.config.model.llm.api_key,
-                max_retries=self.config.model.llm.request_max_try,
+            for idx, request_kwargs in enumerate(request_kwargs_list)
+        )
+        batch_input_file = self.model.files.create(
+            file=("batch_requests.jsonl", jsonl_payload.encode()),
+            purpose="batch",
+        )
+        batch = self.model.batches.create(
+            input_file_id=batch_input_file.id,
+            endpoint=self.BATCH_ENDPOINT,
+            completion_window=completion_window,
+        )
+        return batch.id
+
+    def poll_batch(self, batch_id: str) -> str:
+        """
+        Fetch the current status of a submitted batch.
+
+        Args:
+            batch_id (str): Id returned by ``submit_batch``.
+
+        Returns:
+            str: Batch status, e.g. "validating", "in_progress", "completed".
+        """
+        return self.model.batches.retrieve(batch_id).status
+
+    def retrieve_batch_results(self, batch_id: str) -> dict[str, str]:
+        """
+        Download the outputs of a completed batch.
+
+        Args:
+            batch_id (str): Id returned by ``submit_batch``.
+
+        Returns:
+            dict[str, str]: Mapping of custom_id to response message content,
+            in the same "request-{idx}" scheme used by ``submit_batch``.
+
+        Raises:
+            RuntimeError: If the batch has not completed yet.
+        """
+        batch = self.model.batches.retrieve(batch_id)
+        if batch.status != "completed":
+            raise RuntimeError(
+                f"Batch {batch_id} is not completed (status: {batch.status})"
             )
+        raw_output = self.model.files.content(batch.output_file_id).text
+        results = {}
+        for line in raw_output.splitlines():
+            if not line:
+                continue
+            record = json.loads(line)
+            results[record["custom_id"]] = record["response"]["body"]["choices"][0][
+                "message"
+            ]["content"]
+        return results
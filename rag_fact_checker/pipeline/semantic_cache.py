@@ -0,0 +1,81 @@
+from typing import Any
+
+
+class SemanticCache:
+    """
+    Embedding-similarity cache for near-duplicate LLM requests.
+
+    Embeds a canonical text representation of each request once and returns the
+    stored result of the most similar prior request when its cosine similarity
+    exceeds ``threshold``. This catches paraphrased or reordered inputs that an
+    exact-match cache misses, at the cost of a small risk of returning a result
+    for a slightly different input — which is why it is disabled by default and
+    gated behind config.
+
+    Vectors live in an in-process FAISS inner-product index over L2-normalized
+    embeddings (i.e. cosine similarity); stored results are kept in a parallel
+    list. Requires the optional ``sentence-transformers`` and ``faiss-cpu``
+    dependencies (install with ``pip install rag_fact_checker[semantic-cache]``).
+
+    Attributes:
+        threshold (float): Minimum cosine similarity for a hit.
+        model_name (str): Sentence-transformers model used for embeddings.
+    """
+
+    def __init__(
+        self,
+        threshold: float = 0.95,
+        model_name: str = "all-MiniLM-L6-v2",
+    ):
+        try:
+            import faiss
+            from sentence_transformers import SentenceTransformer
+        except ImportError as e:
+            raise ImportError(
+                "SemanticCache requires the optional dependencies "
+                "'sentence-transformers' and 'faiss-cpu'. "
+                "Install them with: pip install rag_fact_checker[semantic-cache]"
+            ) from e
+
+        self._faiss = faiss
+        self.threshold = threshold
+        self.model_name = model_name
+        self.embedder = SentenceTransformer(model_name)
+        self.index = faiss.IndexFlatIP(
+            self.embedder.get_sentence_embedding_dimension()
+        )
+        self.stored_results: list[Any] = []
+
+    def _embed(self, text: str):
+        embedding = self.embedder.encode([text], convert_to_numpy=True)
+        embedding = embedding.astype("float32")
+        self._faiss.normalize_L2(embedding)
+        return embedding
+
+    def get(self, text: str) -> Any | None:
+        """
+        Return the stored result most similar to ``text`` if above threshold.
+
+        Args:
+            text (str): Canonical text representation of the request.
+
+        Returns:
+            The stored result on a hit, or None on a miss.
+        """
+        if not self.stored_results:
+            return None
+        scores, indices = self.index.search(self._embed(text), 1)
+        if scores[0][0] >= self.threshold:
+            return self.stored_results[indices[0][0]]
+        return None
+
+    def set(self, text: str, result: Any) -> None:
+        """
+        Store a result under the embedding of ``text``.
+
+        Args:
+            text (str): Canonical text representation of the request.
+            result: Result to return for sufficiently similar future requests.
+        """
+        self.index.add(self._embed(text))
+        self.stored_results.append(result)
@@ -75,6 +75,15 @@ DEFAULT_CONFIG = {
         },
         "prompts": "rag_fact_checker/prompt_bank.json",
     },
+    "cache": {
+        "enabled": False,
+        "path": "rag_fact_checker_cache.sqlite",
+        "ttl_seconds": None,
+        "max_entries": 10000,
+        "semantic_enabled": False,
+        "semantic_threshold": 0.95,
+        "semantic_model": "all-MiniLM-L6-v2",
+    },
 }
 
 
@@ -119,7 +128,7 @@ PROMPT_BANK = {
             "input_params": ["input_text"],
         },
         "n_shot_triplet_generation": {
-            "format": 'Input Text: {input_text}\nTask: Extract the key information and logic from the provided text and convert it into a series of triplets in the form of ["subject", "predicate", "object"].\nEnsure the triplets are structured in a way that allows comparison with triplets from other texts to identify common or overlapping information.\n\n(Optional) Few-Shot Demonstrations:\nIf few-shot examples are provided here, they will look like this:\n\n[BEGIN FEW-SHOT-EXAMPLES]\n<Example 1 Input/Output Pair>\n<Example 2 Input/Output Pair>\n...\n[END FEW-SHOT-EXAMPLES]\nIf these examples are present, incorporate their style and approach into your solution.{examples}\n\nLastly, only output the resulting triplets without any additional explanation or formatting.',
+            "format": 'Task: Extract the key information and logic from the provided text and convert it into a series of triplets in the form of ["subject", "predicate", "object"].\nEnsure the triplets are structured in a way that allows comparison with triplets from other texts to identify common or overlapping information.\n\n(Optional) Few-Shot Demonstrations:\nIf few-shot examples are provided here, they will look like this:\n\n[BEGIN FEW-SHOT-EXAMPLES]\n<Example 1 Input/Output Pair>\n<Example 2 Input/Output Pair>\n...\n[END FEW-SHOT-EXAMPLES]\nIf these examples are present, incorporate their style and approach into your solution.{examples}\n\nLastly, only output the resulting triplets without any additional explanation or formatting.\n\nInput Text: {input_text}',
             "input_params": ["input_text", "examples"],
         },
         "triplet_match_test": {
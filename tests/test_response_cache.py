@@ -0,0 +1,31 @@
+import pytest
+
+from rag_fact_checker.pipeline.response_cache import ResponseCache, make_cache_key
+
+orjson = pytest.importorskip("orjson")
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return ResponseCache(str(tmp_path / "cache.sqlite"))
+
+
+def test_set_get_roundtrip(cache):
+    key = make_cache_key({"model": "gpt-4o-mini", "messages": [{"role": "user"}]})
+    cache.set(key, {"answer": "yes"})
+    assert cache.get(key) == {"answer": "yes"}
+
+
+def test_set_accepts_int_keyed_prediction_dict(cache):
+    # Fact checkers cache prediction dicts keyed by triplet index, e.g.
+    # {0: True, 1: False}; with orjson installed this used to raise
+    # "TypeError: Dict key must be str" on every cache-enabled fact check.
+    key = make_cache_key({"fact_check": True})
+    cache.set(key, {0: True, 1: False})
+    # JSON has no int keys, so they come back as strings; callers restore
+    # them with int(idx) when rebuilding the prediction dict.
+    assert cache.get(key) == {"0": True, "1": False}
+
+
+def test_get_miss_returns_none(cache):
+    assert cache.get("missing") is None